@@ -0,0 +1,44 @@
+"""Python side of the Mojo vs asciichartpy comparison benchmark.
+
+Used by benchmarks/bench_python_comparison.mojo. Inputs are built once per
+size, and asciichartpy is timed natively with ``timeit`` inside Python so no
+Mojo interop overhead is included in the Python figures.
+"""
+
+import math
+import timeit
+from typing import List
+
+import asciichartpy
+
+
+def make_series(n: int) -> List[float]:
+    """Two periods of a sine wave with ``n`` points (identical for both sides)."""
+    return [15.0 * math.sin(i * (4.0 * math.pi / n)) for i in range(n)]
+
+
+def time_render(series: List[float], height: int, min_samples: int, budget_secs: float) -> List[float]:
+    """Time ``asciichartpy.plot`` and return per-call seconds, one per sample.
+
+    Each sample runs enough calls to last at least ~20 ms (as
+    ``timeit.Timer.autorange`` does, but with a lower floor), and sampling
+    continues until ``min_samples`` samples and ``budget_secs`` have been
+    spent, whichever takes longer.
+    """
+    cfg = {"height": height}
+    timer = timeit.Timer(lambda: asciichartpy.plot(series, cfg))
+
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= 0.02:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    spent = elapsed
+    while len(samples) < min_samples or spent < budget_secs:
+        elapsed = timer.timeit(number)
+        samples.append(elapsed / number)
+        spent += elapsed
+    return samples
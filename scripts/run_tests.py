@@ -30,7 +30,8 @@ def run_test(test_file: Path, current: int, total: int) -> Tuple[bool, str]:
 
     try:
         result = subprocess.run(
-            ["mojo", "-I", "src", str(test_file)],
+            # cli/ holds the command-line tool's modules (not part of the package)
+            ["mojo", "-I", "src", "-I", "cli", str(test_file)],
             capture_output=True,
             text=True,
             timeout=30,
@@ -0,0 +1,160 @@
+"""Random case generator for the asciichartpy parity harness.
+
+Used by tests/test_parity_fuzz.mojo. All cases are generated and rendered
+with asciichartpy in a single Python session; data crosses the interop
+boundary in bulk as whitespace-separated text (``repr`` round-trips floats
+exactly) so the Mojo side can parse it with its own fast parser.
+
+Each case is encoded as four metadata numbers ``length height min max``
+(``-1`` height and ``nan`` bounds mean "not set") followed by ``length``
+values in a separate values stream.
+"""
+
+import math
+import os
+import random
+from typing import List, Optional, Tuple
+
+import asciichartpy
+
+SEPARATOR = "\x00"
+
+# Cap on chart rows when no height is given (rows == value range then)
+MAX_IMPLICIT_ROWS = 60
+
+Case = Tuple[List[float], Optional[int], Optional[float], Optional[float]]
+
+_cases: List[Case] = []
+
+
+def _series(rng: random.Random) -> List[float]:
+    """Draw one series from a mix of shapes and scales."""
+    kind = rng.choice(["walk", "noise", "constant", "huge", "negative", "tiny", "single"])
+    length = rng.randint(1, 120)
+    if kind == "single":
+        return [rng.uniform(-50, 50)]
+    if kind == "constant":
+        return [rng.choice([0.0, 1.0, -3.5, rng.uniform(-1e3, 1e3)])] * length
+    if kind == "huge":
+        scale = 10 ** rng.randint(3, 9)
+        return [rng.uniform(-scale, scale) for _ in range(length)]
+    if kind == "negative":
+        return [-rng.uniform(0.5, 40) for _ in range(length)]
+    if kind == "tiny":
+        return [rng.uniform(-1e-3, 1e-3) for _ in range(length)]
+    if kind == "noise":
+        return [rng.uniform(-20, 20) for _ in range(length)]
+    value = rng.uniform(-10, 10)
+    walk = []
+    for _ in range(length):
+        value += rng.gauss(0, 2)
+        walk.append(value)
+    return walk
+
+
+def _with_nans(rng: random.Random, series: List[float]) -> List[float]:
+    """Punch NaN runs (possibly covering everything) into a series."""
+    result = list(series)
+    for _ in range(rng.randint(1, 3)):
+        start = rng.randrange(len(result))
+        run = rng.randint(1, max(1, len(result) // 3))
+        for i in range(start, min(len(result), start + run)):
+            result[i] = math.nan
+    if rng.random() < 0.05:
+        result = [math.nan] * len(result)
+    return result
+
+
+def _case(rng: random.Random) -> Case:
+    """Draw a series together with height and min/max overrides."""
+    series = _series(rng)
+    if rng.random() < 0.25:
+        series = _with_nans(rng, series)
+
+    valid = [v for v in series if not math.isnan(v)]
+    lo = min(valid) if valid else 0.0
+    hi = max(valid) if valid else 0.0
+
+    minimum = maximum = None
+    if valid and rng.random() < 0.3:
+        # Overrides may widen the range or cut into the data (clamping)
+        span = (hi - lo) or 1.0
+        minimum = lo + rng.uniform(-0.5, 0.5) * span
+        maximum = max(minimum, hi + rng.uniform(-0.5, 0.5) * span)
+        if rng.random() < 0.3:
+            minimum = None
+            maximum = max(maximum, lo)
+        elif rng.random() < 0.3:
+            maximum = None
+            minimum = min(minimum, hi)
+
+    height = rng.randint(1, 30) if rng.random() < 0.6 else None
+    lo = minimum if minimum is not None else lo
+    hi = maximum if maximum is not None else hi
+    if height is None and hi - lo > MAX_IMPLICIT_ROWS:
+        height = rng.randint(1, 30)
+    return series, height, minimum, maximum
+
+
+def _config(height: Optional[int], minimum: Optional[float], maximum: Optional[float]) -> dict:
+    cfg = {}
+    if height is not None:
+        cfg["height"] = height
+    if minimum is not None:
+        cfg["min"] = minimum
+    if maximum is not None:
+        cfg["max"] = maximum
+    return cfg
+
+
+def _num(value: Optional[float]) -> str:
+    return "nan" if value is None else repr(value)
+
+
+def generate(count: int, seed: int) -> Tuple[str, str]:
+    """Generate cases and return (metadata, values) as whitespace-separated text.
+
+    ``PARITY_FUZZ_CASES`` and ``PARITY_FUZZ_SEED`` override the arguments.
+    """
+    count = int(os.environ.get("PARITY_FUZZ_CASES", count))
+    seed = int(os.environ.get("PARITY_FUZZ_SEED", seed))
+    rng = random.Random(seed)
+    _cases.clear()
+    meta = []
+    values = []
+    for _ in range(count):
+        series, height, minimum, maximum = _case(rng)
+        _cases.append((series, height, minimum, maximum))
+        meta.append(
+            f"{len(series)} {-1 if height is None else height} {_num(minimum)} {_num(maximum)}"
+        )
+        values.append(" ".join(repr(v) for v in series))
+    return "\n".join(meta), "\n".join(values)
+
+
+def compare(mojo_outputs: str) -> str:
+    """Render every generated case with asciichartpy and diff against Mojo.
+
+    Returns the indices of mismatching cases as whitespace-separated text.
+    """
+    outputs = mojo_outputs.split(SEPARATOR)
+    if len(outputs) != len(_cases):
+        raise ValueError(f"expected {len(_cases)} outputs, got {len(outputs)}")
+    failures = []
+    for i, (series, height, minimum, maximum) in enumerate(_cases):
+        if asciichartpy.plot(series, _config(height, minimum, maximum)) != outputs[i]:
+            failures.append(str(i))
+    return " ".join(failures)
+
+
+def render(values: str, height: int, minimum: float, maximum: float) -> str:
+    """Render one case given in the harness encoding (used while shrinking)."""
+    series = [float(v) for v in values.split()]
+    return asciichartpy.plot(
+        series,
+        _config(
+            None if height < 0 else height,
+            None if math.isnan(minimum) else minimum,
+            None if math.isnan(maximum) else maximum,
+        ),
+    )